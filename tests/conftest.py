@@ -0,0 +1,180 @@
+from datetime import date, datetime, time
+from typing import Optional
+
+import polars as pl
+import pytest
+from pydantic import BaseModel
+
+from polarity.caster import PolarsCaster
+
+
+class BasicModel(BaseModel):
+    id: int
+    nombre: Optional[str] = None
+    edad: Optional[int] = None
+    fecha: Optional[date] = None
+    activo: Optional[bool] = None
+    salario: Optional[float] = None
+
+
+class SimpleModel(BaseModel):
+    id: int
+    nombre: Optional[str] = None
+
+
+class TiposModel(BaseModel):
+    id: int
+    int_col: Optional[int] = None
+    float_col: Optional[float] = None
+    str_col: Optional[str] = None
+    bool_col: Optional[bool] = None
+    date_col: Optional[date] = None
+    time_col: Optional[time] = None
+    datetime_col: Optional[datetime] = None
+    categorical_col: Optional[str] = None
+    binary_col: Optional[bytes] = None
+
+
+class CodigoModel(BaseModel):
+    id: int
+    codigo: Optional[str] = None
+
+
+class FechaModel(BaseModel):
+    id: int
+    fecha: Optional[date] = None
+
+
+class FloatModel(BaseModel):
+    id: int
+    float_col: Optional[float] = None
+
+
+@pytest.fixture(scope="module")
+def caster_basic():
+    return PolarsCaster({"test_schema": BasicModel})
+
+
+@pytest.fixture(scope="module")
+def caster_simple():
+    return PolarsCaster({"test_schema": SimpleModel})
+
+
+@pytest.fixture(scope="module")
+def caster_tipos():
+    return PolarsCaster({"test_schema": TiposModel})
+
+
+@pytest.fixture(scope="module")
+def caster_codigo():
+    return PolarsCaster({"test_schema": CodigoModel})
+
+
+@pytest.fixture(scope="module")
+def caster_fecha():
+    return PolarsCaster({"test_schema": FechaModel})
+
+
+@pytest.fixture(scope="module")
+def caster_float():
+    return PolarsCaster({"test_schema": FloatModel})
+
+
+@pytest.fixture(scope="module")
+def basico_frames():
+    df_new = pl.DataFrame({
+        'id': [1, 2, 3, 4],
+        'nombre': ['Ana', 'Luis', 'María', 'Pedro'],
+        'edad': [25, None, 30, 22],
+        'fecha': [date(2021, 1, 1), date(2021, 2, 1), None, date(2021, 4, 1)],
+        'activo': [True, False, True, None],
+        'salario': [50000.0, 60000.5, None, 55000.0],
+    })
+
+    df_db = pl.DataFrame({
+        'id': [2, 3, 5],
+        'nombre': ['Luis', 'María', 'Carlos'],
+        'edad': [None, 30, 28],
+        'fecha': [date(2021, 2, 1), None, date(2021, 5, 1)],
+        'activo': [False, True, True],
+        'salario': [60000.5, None, 48000.0],
+    })
+
+    return df_new, df_db
+
+
+@pytest.fixture(scope="module")
+def tipos_frames():
+    df_new = pl.DataFrame({
+        'id': [1, 2],
+        'int_col': [10, None],
+        'float_col': [None, 20.5],
+        'str_col': ['texto', None],
+        'bool_col': [True, False],
+        'date_col': [date(2021, 1, 1), None],
+        'time_col': [time(12, 0, 0), None],
+        'datetime_col': [datetime(2021, 1, 1, 12, 0, 0), None],
+        'categorical_col': ['cat1', 'cat2'],
+        'binary_col': [b'\x00\x01', b'\x02\x03'],
+    })
+
+    df_db = pl.DataFrame({
+        'id': [2, 3],
+        'int_col': [None, 30],
+        'float_col': [20.5, None],
+        'str_col': [None, 'texto3'],
+        'bool_col': [False, True],
+        'date_col': [None, date(2021, 3, 1)],
+        'time_col': [None, time(13, 0, 0)],
+        'datetime_col': [None, datetime(2021, 3, 1, 13, 0, 0)],
+        'categorical_col': ['cat2', 'cat3'],
+        'binary_col': [b'\x02\x03', b'\x04\x05'],
+    })
+
+    return df_new, df_db
+
+
+@pytest.fixture(scope="module")
+def todos_los_casos_frames():
+    df_new = pl.DataFrame({
+        'id': [1, 2, 3, 4, 5],
+        'nombre': ['Ana', 'Luis', 'María', 'Pedro', 'Juan'],
+        'edad': [25, None, 30, 22, 40],
+        'fecha': [date(2021, 1, 1), date(2021, 2, 1), None, date(2021, 4, 1), date(2021, 5, 1)],
+        'activo': [True, False, True, None, True],
+        'salario': [50000.0, 60000.5, None, 55000.0, 62000.0],
+    })
+
+    df_db = pl.DataFrame({
+        'id': [2, 3, 5],
+        'nombre': ['Luis', 'María', 'Juan'],
+        'edad': [None, 30, 45],  # Edad de 'Juan' diferente
+        'fecha': [date(2021, 2, 1), None, date(2021, 5, 1)],
+        'activo': [False, True, True],
+        'salario': [60000.5, None, 62000.0],
+    })
+
+    return df_new, df_db
+
+
+@pytest.fixture(scope="module")
+def valores_nulls_frames():
+    df_new = pl.DataFrame({
+        'id': [1, 2, 3, 4],
+        'nombre': ['Ana', None, 'María', 'Pedro'],
+        'edad': [25, None, None, 22],
+        'fecha': [date(2021, 1, 1), date(2021, 2, 1), None, None],
+        'activo': [True, False, None, None],
+        'salario': [50000.0, None, None, 55000.0],
+    })
+
+    df_db = pl.DataFrame({
+        'id': [2, 3, 5],
+        'nombre': [None, 'María', 'Carlos'],
+        'edad': [None, None, 28],
+        'fecha': [date(2021, 2, 1), None, date(2021, 5, 1)],
+        'activo': [None, None, True],
+        'salario': [None, None, 48000.0],
+    })
+
+    return df_new, df_db
@@ -199,16 +199,16 @@ def test_validate_and_correct_date_formats_with_polars2():
     # Optional: Test with strict mode to see exact matches
     # This could be useful for debugging which formats fail
     parsed_rows = []
-    for row in df.to_dicts():
+    for date_s, dt_s in zip(df["date_field"], df["datetime_field"]):
         try:
-            date_val = caster.parse_date(row["date_field"])
-            dt_val = caster.parse_datetime(row["datetime_field"])
+            date_val = caster.parse_date(date_s)
+            dt_val = caster.parse_datetime(dt_s)
             if date_val and dt_val:
                 parsed_rows.append({
                     "date_field": date_val,
                     "datetime_field": dt_val,
-                    "original_date": row["date_field"],
-                    "original_datetime": row["datetime_field"]
+                    "original_date": date_s,
+                    "original_datetime": dt_s
                 })
         except Exception as e:
             print(e)